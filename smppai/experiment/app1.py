@@ -8,6 +8,8 @@ import smpplib
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+_LENGTH = struct.Struct('>L')
+
 # class Connection:
 #     def __init__(self,
 #             address,
@@ -143,9 +145,9 @@ def _recv_exact(sock, exact_size):
     logger.debug('_recv_exact')
     while received < exact_size:
         try:
-            logger.debug(f'{received=}')
+            logger.debug('received=%d', received)
             part = sock.recv(exact_size - received)
-            logger.debug(f'{part=}')
+            logger.debug('part=%r', part)
         except socket.timeout:
             logger.debug('timeout')
             raise
@@ -163,10 +165,10 @@ def read_pdu(sock):
     logger.debug('Waiting for PDU...')
 
     raw_len = _recv_exact(sock, 4)
-    logger.debug(f'{raw_len=}')
+    logger.debug('raw_len=%r', raw_len)
 
     try:
-        length = struct.unpack('>L', raw_len)[0]
+        length = _LENGTH.unpack(raw_len)[0]
     except struct.error:
         logger.warning('Receive broken pdu... %s', repr(raw_len))
 
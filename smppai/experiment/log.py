@@ -17,14 +17,13 @@ class ColorFormatter(logging.Formatter):
         'CRITICAL': '\033[02;47m\033[01;31m',
     }
 
-    def format(self, record) -> str:
-        prefix = self.COLORS.get(record.levelname)
-        message = super().format(record)
-
-        if prefix:
-            message = f'{prefix}{message}\033[0m'
+    _WRAP = {level: (prefix, '\033[0m') for level, prefix in COLORS.items()}
 
-        return message
+    def format(self, record) -> str:
+        wrap = self._WRAP.get(record.levelname)
+        if wrap:
+            return wrap[0] + super().format(record) + wrap[1]
+        return super().format(record)
 
 
 def setup_logging(logger: logging.Logger):
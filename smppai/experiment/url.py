@@ -5,7 +5,7 @@ import re
 from urllib.parse import unquote
 
 
-@dtc.dataclass(frozen=True)
+@dtc.dataclass(frozen=True, slots=True)
 class URL:
     protocol: str
     username: str
@@ -16,26 +16,27 @@ class URL:
     as_dict = dtc.asdict
 
 
-def _parse_url(url: str) -> URL:
-    pattern = re.compile(
-        r'''
-            (?P<protocol>[\w\+]+)://
-            (?:
-                (?P<username>[^:/]*)
-                (?::(?P<password>[^@]*))?
-            @)?
+_URL_PATTERN = re.compile(
+    r'''
+        (?P<protocol>[\w\+]+)://
+        (?:
+            (?P<username>[^:/]*)
+            (?::(?P<password>[^@]*))?
+        @)?
+        (?:
             (?:
-                (?:
-                    \[(?P<ipv6host>[^/\?]+)\] |
-                    (?P<ipv4host>[^/:\?]+)
-                )?
-                (?::(?P<port>[^/\?]*))?
+                \[(?P<ipv6host>[^/\?]+)\] |
+                (?P<ipv4host>[^/:\?]+)
             )?
-            ''',
-        re.X,
-    )
+            (?::(?P<port>[^/\?]*))?
+        )?
+        ''',
+    re.X,
+)
+
 
-    m = pattern.match(url)
+def _parse_url(url: str) -> URL:
+    m = _URL_PATTERN.match(url)
     if m is not None:
         components = m.groupdict()
 
@@ -60,8 +61,11 @@ def _parse_url(url: str) -> URL:
         raise AttributeError(f'Could not parse SMPP server URL from string "{url}"')
 
 
+_QUOTE_PATTERN = re.compile(r'[:@/]')
+
+
 def _url_quote(text: str) -> str:
-    return re.sub(r'[:@/]', lambda m: '%%%X' % ord(m.group(0)), text)
+    return _QUOTE_PATTERN.sub(lambda m: '%%%X' % ord(m.group(0)), text)
 
 
 _url_unquote = unquote
@@ -1,11 +1,12 @@
 import dataclasses as dtc
 import enum
+import functools
 import logging
 from urllib.parse import urlparse
 
 import smpplib
 
-from .esme import Esme
+from smppai.esme import Esme
 
 logger = logging.getLogger('session')
 
@@ -18,7 +19,9 @@ class ConnectionInfo:
     host: str
     port: int = 2775
 
-    as_dict = dtc.asdict
+    def as_dict(self) -> dict:
+        # flat fields only, so skip the recursive deep copy of dtc.asdict
+        return {f.name: getattr(self, f.name) for f in dtc.fields(self)}
 
     def __str__(self):
         return '{}://{}@{}:{}'.format(self.scheme, self.username, self.host, self.port)
@@ -32,6 +35,11 @@ class SessionState(enum.Enum):
     CLOSED = 'CLOSED'
 
 
+_BOUND_STATES = frozenset(
+    (SessionState.BOUND_TX, SessionState.BOUND_RX, SessionState.BOUND_TRX)
+)
+
+
 class Session:
     def __init__(self, connection_info: ConnectionInfo) -> None:
         self._cinfo = connection_info
@@ -67,11 +75,7 @@ class Session:
     def __exit__(self, exc_type, exc_value, exc_tb):
         logger.debug('exiting session')
         assert self._esme is not None
-        if self._state in (
-            SessionState.BOUND_TRX,
-            SessionState.BOUND_RX,
-            SessionState.BOUND_TX,
-        ):
+        if self._state in _BOUND_STATES:
             self._esme.send_unbind()
             self._esme.disconnect_from_smsc()
         else:
@@ -80,8 +84,13 @@ class Session:
         logger.debug('session exited')
 
 
-def create_session(uri: str) -> Session:
+@functools.lru_cache(maxsize=128)
+def _parse_uri(uri: str) -> ConnectionInfo:
+    # ConnectionInfo is frozen, so reconnecting sessions can share one instance
     p = urlparse(uri)
     host = p.hostname if p.hostname else 'localhost'
-    conn_info = ConnectionInfo(p.scheme, p.username, p.password, host, p.port)
-    return Session(conn_info)
+    return ConnectionInfo(p.scheme, p.username, p.password, host, p.port)
+
+
+def create_session(uri: str) -> Session:
+    return Session(_parse_uri(uri))
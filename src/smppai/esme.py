@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import socket
 import struct
@@ -13,6 +14,8 @@ PDU = smpplib.pdu.PDU
 
 HEADER_SIZE: int = 4
 
+_LENGTH = struct.Struct('>L')
+
 
 class Connection:
     def __init__(
@@ -21,18 +24,28 @@ class Connection:
         family: int = socket.AF_INET,
         type: int = socket.SOCK_STREAM,
         timeout: int = 10,
+        sndbuf: int | None = 65536,
+        rcvbuf: int | None = 65536,
     ):
         self._address = address
         self._family = family
         self._type = type
         self._sock = None
         self._timeout = timeout
+        self._sndbuf = sndbuf
+        self._rcvbuf = rcvbuf
 
     def connect(self):
         if self._sock is not None:
             raise RuntimeError('already connected')
         self._sock = socket.socket(self._family, self._type)
         self._sock.settimeout(self._timeout)
+        # PDUs are small; size the kernel buffers for bursts of submit_sm rather
+        # than relying on the defaults (use None to keep the system default)
+        if self._sndbuf is not None:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._sndbuf)
+        if self._rcvbuf is not None:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._rcvbuf)
         self._sock.connect(self._address)
         logger.debug(f'connected: {self._address}')
         return self._sock
@@ -42,6 +55,13 @@ class Connection:
         self._sock = None
         logger.debug(f'disconnected: {self._address}')
 
+    def setblocking(self, flag: bool):
+        # back in blocking mode the configured timeout applies again
+        if flag:
+            self._sock.settimeout(self._timeout)
+        else:
+            self._sock.setblocking(False)
+
     def sendall(self, data: bytes):
         try:
             self._sock.sendall(data)
@@ -50,13 +70,13 @@ class Connection:
             raise ConnectionError()
 
     def recv(self, length: int = HEADER_SIZE) -> bytes:
-        logger.debug(f'receiving {length=}')
+        logger.debug('receiving length=%d', length)
         chunks = []
         bytes_received = 0
         while bytes_received < length:
             try:
                 chunk = self._sock.recv(length - bytes_received)
-                logger.debug(f'{chunk=}')
+                logger.debug('chunk=%r', chunk)
             except socket.timeout:
                 logger.debug('timeout while receiving')
                 raise
@@ -69,11 +89,45 @@ class Connection:
             chunks.append(chunk)
         return b''.join(chunks)
 
+    async def recv_async(self, length: int = HEADER_SIZE) -> bytes:
+        loop = asyncio.get_running_loop()
+        chunks = []
+        bytes_received = 0
+        while bytes_received < length:
+            try:
+                chunk = await loop.sock_recv(self._sock, length - bytes_received)
+            except OSError as e:
+                logger.warning(e)
+                raise smpplib.exceptions.ConnectionError()
+            if not chunk:
+                raise smpplib.exceptions.ConnectionError()
+            bytes_received += len(chunk)
+            chunks.append(chunk)
+        return b''.join(chunks)
+
 
 class ConnectionError(Exception):
     pass
 
 
+def _on_submit_sm_resp(pdu: PDU):
+    logger.debug('<submit_sm_resp> received')
+
+
+def _on_deliver_sm(pdu: PDU):
+    logger.debug('<deliver_sm> received')
+
+
+def _on_unhandled(pdu: PDU):
+    logger.warning(f'unhandled pdu {pdu=}')
+
+
+_HANDLERS = {
+    smpplib.command.SubmitSMResp: _on_submit_sm_resp,
+    smpplib.command.DeliverSM: _on_deliver_sm,
+}
+
+
 class Esme:
     def __init__(self, *, host: str, port: int, username: str, password: str, **kwargs):
         self._conn: Connection = None
@@ -90,31 +144,45 @@ class Esme:
         self._conn.disconnect()
 
     def _send_pdu(self, cmd: PDU):
-        logger.debug(f'sending pdu {cmd=}')
+        logger.debug('sending pdu cmd=%r', cmd)
         self._conn.sendall(cmd.generate())
 
     def _recv_header(self) -> tuple[bytes, int]:
         header = self._conn.recv(HEADER_SIZE)
-        length = struct.unpack('>L', header)[0]
+        length = _LENGTH.unpack_from(header)[0]
         return header, length
 
     def _recv_pdu_bytes(self) -> bytes:
         logger.debug('receiving pdu')
         header, length = self._recv_header()
         payload = header + self._conn.recv(length - HEADER_SIZE)
-        logger.debug(f'received {payload=!r}')
+        logger.debug('received payload=%r', payload)
         return payload
 
     def recv_pdu(self) -> PDU:
         payload = self._recv_pdu_bytes()
         pdu = decoder.decode(payload)
-        logger.info(f'received pdu {pdu=}')
+        logger.info('received pdu pdu=%r', pdu)
         return pdu
 
     def listen_forever(self):
         while True:
             self.recv_pdu()
 
+    async def listen_forever_async(self):
+        # the event loop needs a non-blocking socket; restore the timeout on the
+        # way out so the synchronous send/recv methods keep working
+        self._conn.setblocking(False)
+        try:
+            while True:
+                header = await self._conn.recv_async(HEADER_SIZE)
+                length = _LENGTH.unpack_from(header)[0]
+                payload = header + await self._conn.recv_async(length - HEADER_SIZE)
+                pdu = decoder.decode(payload)
+                _HANDLERS.get(type(pdu), _on_unhandled)(pdu)
+        finally:
+            self._conn.setblocking(True)
+
     def send_bind_transceiver(self):
         logger.debug('prepare to send <bind_transceiver>')
         params = {'system_id': self._username, 'password': self._password}
@@ -137,10 +205,8 @@ class Esme:
         for cmd in cmds:
             self._send_pdu(cmd)
             resp = self.recv_pdu()
-            match type(resp):
-                case smpplib.command.SubmitSMResp:
-                    logger.debug('<submit_sm_resp> received')
-                case smpplib.command.DeliverSM:
-                    logger.debug('<deliver_sm> received')
-                case _:
-                    logger.warning('error while sending <submit_sm>')
+            handler = _HANDLERS.get(type(resp))
+            if handler:
+                handler(resp)
+            else:
+                logger.warning('error while sending <submit_sm>')
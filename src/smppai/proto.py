@@ -1,20 +1,50 @@
 import asyncio
 import logging
+import socket
 
 HEADER_SIZE = 4
 
 logger = logging.getLogger('proto')
 
 
-async def send_data(stream: asyncio.StreamWriter, data: bytes):
-    stream.write(data)
-    logger.debug(f'data sent: {data=}')
+async def send_data(stream: asyncio.StreamWriter, data: bytes | list[bytes]):
+    if isinstance(data, (list, tuple)):
+        stream.writelines(data)
+    else:
+        stream.write(data)
+    logger.debug('data sent: data=%r', data)
     await stream.drain()
 
 
 async def read_data(stream: asyncio.StreamReader) -> bytes:
     header = await stream.readexactly(HEADER_SIZE)
     size = int.from_bytes(header, byteorder='big')
-    payload = await stream.readexactly(size - HEADER_SIZE)
-    logger.debug(f'data read {header + payload}')
-    return header + payload
+    data = header + await stream.readexactly(size - HEADER_SIZE)
+    logger.debug('data read %s', data)
+    return data
+
+
+async def _recv_into(sock: socket.socket, buf: bytearray, start: int = 0):
+    # fills buf[start:]; on EOF the partial data includes everything before start
+    loop = asyncio.get_running_loop()
+    view = memoryview(buf)
+    received = start
+    while received < len(buf):
+        nbytes = await loop.sock_recv_into(sock, view[received:])
+        if not nbytes:
+            raise asyncio.IncompleteReadError(bytes(buf[:received]), len(buf))
+        received += nbytes
+
+
+async def read_data_direct(sock: socket.socket) -> bytearray:
+    # Reads from a raw non-blocking socket straight into a buffer sized for the
+    # whole PDU, skipping the copy through the StreamReader buffer. The buffer
+    # itself is returned; convert with bytes() if an immutable copy is needed.
+    header = bytearray(HEADER_SIZE)
+    await _recv_into(sock, header)
+    size = int.from_bytes(header, byteorder='big')
+    buf = bytearray(size)
+    buf[:HEADER_SIZE] = header
+    await _recv_into(sock, buf, HEADER_SIZE)
+    logger.debug('data read %s', buf)
+    return buf
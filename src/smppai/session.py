@@ -1,6 +1,9 @@
 import asyncio
+import contextlib
 import dataclasses as dtc
 import enum
+import functools
+import itertools
 import logging
 from urllib.parse import urlparse
 
@@ -21,12 +24,22 @@ class ConnectionInfo:
     host: str
     port: int = 2775
 
-    as_dict = dtc.asdict
+    def as_dict(self) -> dict:
+        # flat fields only, so skip the recursive deep copy of dtc.asdict
+        return {f.name: getattr(self, f.name) for f in dtc.fields(self)}
 
     def __str__(self):
         return '{}://{}@{}:{}'.format(self.scheme, self.username, self.host, self.port)
 
 
+@dtc.dataclass(frozen=True, slots=True)
+class Message:
+    src: str
+    dest: str
+    message: str | bytes
+    data_coding: int | None = None
+
+
 class SessionState(enum.Enum):
     OPEN = 'OPEN'
     BOUND_TX = 'BOUND_TX'
@@ -36,27 +49,57 @@ class SessionState(enum.Enum):
 
 
 class Session:
-    def __init__(self, connection_info: ConnectionInfo) -> None:
+    def __init__(
+        self, connection_info: ConnectionInfo, connect_timeout: float | None = 10
+    ) -> None:
         self._cinfo = connection_info
+        self._connect_timeout = connect_timeout
         self._state: SessionState = SessionState.OPEN
         self._reader: asyncio.StreamReader = None
         self._writer: asyncio.StreamWriter = None
         self._message_listener: asyncio.Task = None
+        self._connected = asyncio.Event()
 
     @property
     def state(self):
         return self._state
 
-    async def send_message(self, *, src: str, dest: str, message: str):
+    @property
+    def closing(self) -> bool:
+        return self._writer is None or self._writer.is_closing()
+
+    async def send_message(
+        self,
+        *,
+        src: str,
+        dest: str,
+        message: str | bytes,
+        data_coding: int | None = None,
+    ):
+        # bytes are sent as already encoded in data_coding (SMSC default if None)
         logger.debug('sending message')
-        for data in helpers.enc_submit_sm(src, dest, message):
-            await send_data(self._writer, data)
+        frames = helpers.enc_submit_sm(src, dest, message, data_coding)
+        await send_data(self._writer, frames)
         logger.debug('message sent')
 
+    async def send_messages(self, messages: list[Message]):
+        # all PDUs go out in a single write and drain; build one Message and
+        # dtc.replace() it per recipient when sending the same text many times
+        logger.debug(f'sending {len(messages)} messages')
+        frames = []
+        for m in messages:
+            frames.extend(
+                helpers.enc_submit_sm(m.src, m.dest, m.message, m.data_coding)
+            )
+        await send_data(self._writer, frames)
+        logger.debug('messages sent')
+
+    async def enquire_link(self):
+        await send_data(self._writer, helpers.enc_enquire_link())
+
     async def _send_enquire_link(self):
-        data = helpers.enc_enquire_link()
         while True:
-            await send_data(self._writer, data)
+            await send_data(self._writer, helpers.enc_enquire_link())
             await asyncio.sleep(10)
 
     async def _connect(self):
@@ -65,9 +108,17 @@ class Session:
             self._reader, self._writer = await asyncio.open_connection(
                 self._cinfo.host, self._cinfo.port
             )
+            self._connected.set()
         else:
             logger.warning('connection already opened')
 
+    async def wait_until_connected(self, timeout: float | None = None) -> bool:
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     async def __aenter__(self):
         logger.debug('entering session')
         await self._connect()
@@ -77,27 +128,120 @@ class Session:
 
     async def __aexit__(self, exc_type, exc_value, exc_tb):
         logger.debug('exiting session')
+        self._connected.clear()
+        self._state = SessionState.CLOSED
         self._writer.close()
         await self._writer.wait_closed()
         logger.debug('session exited')
 
     async def __aiter__(self) -> PDU:
-        # await self._connect()
-        if self._reader:
-            while True:
-                try:
-                    while (pdu := await read_data(self._reader)) != b'':
-                        cmd = decoder.decode(pdu)
-                        logger.debug(f'received in loop {pdu=}')
-                        logger.debug(f'received in loop {cmd=}')
-                        yield cmd
-                except asyncio.exceptions.IncompleteReadError as e:
-                    logger.warning(f'server closed: {e}')
-                    break
+        # nothing to read from a closed session or one that never connects
+        if self._state is SessionState.CLOSED:
+            return
+        if not await self.wait_until_connected(self._connect_timeout):
+            logger.warning('session not connected, nothing to iterate')
+            return
+        while True:
+            try:
+                while (pdu := await read_data(self._reader)) != b'':
+                    cmd = decoder.decode(pdu)
+                    logger.debug('received in loop pdu=%r', pdu)
+                    logger.debug('received in loop cmd=%r', cmd)
+                    yield cmd
+            except asyncio.exceptions.IncompleteReadError as e:
+                logger.warning(f'server closed: {e}')
+                break
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_uri(uri: str) -> ConnectionInfo:
+    # ConnectionInfo is frozen, so reconnecting sessions can share one instance
+    p = urlparse(uri)
+    host = p.hostname if p.hostname else 'localhost'
+    return ConnectionInfo(p.scheme, p.username, p.password, host, p.port)
 
 
 def create_session(uri: str) -> Session:
-    p = urlparse(uri)
-    host = p.hostname if p.hostname else 'localhost'
-    conn_info = ConnectionInfo(p.scheme, p.username, p.password, host, p.port)
-    return Session(conn_info)
+    return Session(_parse_uri(uri))
+
+
+class SessionPool:
+    def __init__(self, uri: str, size: int, enquire_link_interval: float = 10) -> None:
+        if size < 1:
+            raise ValueError(f'pool size must be at least 1, got {size}')
+        self._sessions = [create_session(uri) for _ in range(size)]
+        self._next_session = itertools.cycle(self._sessions)
+        self._enquire_link_interval = enquire_link_interval
+        self._keepalive: asyncio.Task = None
+
+    @property
+    def sessions(self) -> list[Session]:
+        return self._sessions
+
+    async def send_message(
+        self,
+        *,
+        src: str,
+        dest: str,
+        message: str | bytes,
+        data_coding: int | None = None,
+    ):
+        # sessions are not reconnected yet, so skip the ones that dropped
+        for _ in range(len(self._sessions)):
+            session = next(self._next_session)
+            if not session.closing:
+                break
+        else:
+            raise ConnectionError('no open session left in the pool')
+        await session.send_message(
+            src=src, dest=dest, message=message, data_coding=data_coding
+        )
+
+    async def _send_enquire_link(self):
+        # one timer for the whole pool instead of one per session
+        while True:
+            await asyncio.sleep(self._enquire_link_interval)
+            for session in self._sessions:
+                if session.closing:
+                    continue
+                # a dropped session must not stop keepalives for the others
+                try:
+                    await session.enquire_link()
+                except Exception as e:
+                    logger.warning(f'enquire_link failed: {e!r}')
+
+    async def _close_sessions(self, exc_type=None, exc_value=None, exc_tb=None):
+        # close every opened session even if some of them fail to close
+        opened = [s for s in self._sessions if s._writer is not None]
+        results = await asyncio.gather(
+            *(s.__aexit__(exc_type, exc_value, exc_tb) for s in opened),
+            return_exceptions=True,
+        )
+        for r in results:
+            if isinstance(r, Exception):
+                logger.warning(f'error while closing session: {r!r}')
+
+    async def __aenter__(self):
+        logger.debug(f'entering pool of {len(self._sessions)} sessions')
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for s in self._sessions:
+                    tg.create_task(s.__aenter__())
+        except BaseException as e:
+            # a failed bind cancels the others, close whatever got connected
+            await self._close_sessions()
+            # raise the first failure itself so callers can catch e.g. OSError
+            if isinstance(e, BaseExceptionGroup):
+                raise e.exceptions[0] from e
+            raise
+        self._keepalive = asyncio.create_task(self._send_enquire_link())
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        logger.debug('exiting pool')
+        if self._keepalive:
+            self._keepalive.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._keepalive
+            self._keepalive = None
+        await self._close_sessions(exc_type, exc_value, exc_tb)
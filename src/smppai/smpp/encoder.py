@@ -1,4 +1,6 @@
+import functools
 import logging
+import struct
 
 import smpplib
 from smpplib import gsm
@@ -22,16 +24,48 @@ def bind_transceiver(**kwargs) -> bytes:
     return p.generate()
 
 
+# PDUs without parameters only differ in their sequence number: the encoded
+# PDU is built once and the current sequence is written into the copy
+_SEQUENCE = struct.Struct('>L')
+_SEQUENCE_OFFSET = 12
+
+
+def _with_sequence(template: bytes) -> bytes:
+    data = bytearray(template)
+    _SEQUENCE.pack_into(data, _SEQUENCE_OFFSET, sequencer().next_sequence())
+    return bytes(data)
+
+
+@functools.cache
+def _template(command: str) -> bytes:
+    p: PDU = smpplib.smpp.make_pdu(command, client=sequencer())
+    return p.generate()
+
+
 def unbind() -> bytes:
     logger.debug('encode <unbind> using no kwargs')
-    p: PDU = smpplib.smpp.make_pdu('unbind', client=sequencer())
-    return p.generate()
+    return _with_sequence(_template('unbind'))
 
 
 def enquire_link() -> bytes:
     logger.debug('encode <enquire_link> using no kwargs')
-    p: PDU = smpplib.smpp.make_pdu('enquire_link', client=sequencer())
-    return p.generate()
+    return _with_sequence(_template('enquire_link'))
+
+
+_OCTET_SIZES = gsm.ENCODINGS[smpplib.consts.SMPP_ENCODING_ISO88591]
+
+
+def _make_parts(message: str | bytes, encoding: int) -> tuple[list[bytes], int, int]:
+    if isinstance(message, str):
+        return gsm.make_parts(message, encoding)
+
+    # already encoded by the caller, only split into parts; codings smpplib has
+    # no text codec for (binary, latin-1, ...) use the 8-bit part sizes
+    _, split_length, part_size = gsm.ENCODINGS.get(encoding, _OCTET_SIZES)
+    if len(message) > split_length:
+        parts = gsm.make_parts_encoded(message, part_size)
+        return parts, encoding, smpplib.consts.SMPP_GSMFEAT_UDHI
+    return [message], encoding, smpplib.consts.SMPP_MSGTYPE_DEFAULT
 
 
 def submit_sm(**kwargs) -> list[bytes]:
@@ -39,12 +73,13 @@ def submit_sm(**kwargs) -> list[bytes]:
     assert 'destination_addr' in kwargs
     assert 'short_message' in kwargs
 
-    logger.debug(f'encode <submit_sm> using {kwargs=}')
+    logger.debug('encode <submit_sm> using kwargs=%r', kwargs)
 
     message = kwargs['short_message']
+    data_coding = kwargs.get('data_coding', smpplib.consts.SMPP_ENCODING_DEFAULT)
 
     pdus: list[PDU] = []
-    parts, encoding_flag, msg_type_flag = gsm.make_parts(message)
+    parts, encoding_flag, msg_type_flag = _make_parts(message, data_coding)
     for part in parts:
         params = {
             'source_addr': kwargs['source_addr'],
@@ -57,6 +92,6 @@ def submit_sm(**kwargs) -> list[bytes]:
             'registered_delivery': True,
         }
         pdu = smpplib.smpp.make_pdu('submit_sm', client=sequencer(), **params)
-        logger.debug(f'appending {pdu=} to pdus list')
+        logger.debug('appending pdu=%r to pdus list', pdu)
         pdus.append(pdu)
     return [p.generate() for p in pdus]
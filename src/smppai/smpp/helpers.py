@@ -9,7 +9,7 @@ def enc_bind_transceiver() -> bytes:
     logger.debug('prepare to send <bind_transceiver>')
     params = {'system_id': 'smppclient1', 'password': 'password'}
     data = encoder.bind_transceiver(**params)
-    logger.debug(f'pdu to send: {data=}')
+    logger.debug('pdu to send: data=%r', data)
     return data
 
 
@@ -17,15 +17,19 @@ def enc_enquire_link() -> bytes:
     logger.debug('prepare to send <enquire_link>')
     params = {}
     data = encoder.enquire_link(**params)
-    logger.debug(f'pdu to send: {data=}')
+    logger.debug('pdu to send: data=%r', data)
     return data
 
 
-def enc_submit_sm(src: str, dest: str, message: str) -> list[bytes]:
+def enc_submit_sm(
+    src: str, dest: str, message: str | bytes, data_coding: int | None = None
+) -> list[bytes]:
     logger.debug('prepare to send <submit_sm>')
     params = {
         'source_addr': src,
         'destination_addr': dest,
         'short_message': message,
     }
+    if data_coding is not None:
+        params['data_coding'] = data_coding
     return encoder.submit_sm(**params)
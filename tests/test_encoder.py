@@ -0,0 +1,40 @@
+import smpplib
+
+from smppai.smpp import decoder
+from smppai.smpp import encoder
+
+BINARY = 0x04
+
+
+def test_submit_sm_bytes_single_part():
+    frames = encoder.submit_sm(
+        source_addr='aaa',
+        destination_addr='bbb',
+        short_message=b'\x01\x02\x03',
+        data_coding=BINARY,
+    )
+
+    assert len(frames) == 1
+    pdu = decoder.decode(frames[0])
+    assert pdu.short_message == b'\x01\x02\x03'
+    assert pdu.data_coding == BINARY
+    assert pdu.esm_class == smpplib.consts.SMPP_MSGTYPE_DEFAULT
+
+
+def test_submit_sm_bytes_split_with_udh():
+    message = bytes(range(256)) + bytes(44)
+    frames = encoder.submit_sm(
+        source_addr='aaa',
+        destination_addr='bbb',
+        short_message=message,
+        data_coding=BINARY,
+    )
+
+    pdus = [decoder.decode(f) for f in frames]
+    assert len(pdus) == 3
+    for pdu in pdus:
+        assert pdu.data_coding == BINARY
+        assert pdu.esm_class == smpplib.consts.SMPP_GSMFEAT_UDHI
+        assert pdu.short_message[:3] == b'\x05\x00\x03'
+    # six octets of UDH in front of every part
+    assert b''.join(p.short_message[6:] for p in pdus) == message
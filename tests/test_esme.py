@@ -0,0 +1,54 @@
+import asyncio
+import socket
+
+import pytest as pt
+import smpplib
+
+from smppai import esme
+
+# submit_sm_resp, sequence 1, empty message_id
+SUBMIT_SM_RESP = b'\x00\x00\x00\x11\x80\x00\x00\x04\x00\x00\x00\x00\x00\x00\x00\x01\x00'
+
+
+@pt.fixture
+def esme_pair():
+    a, b = socket.socketpair()
+    e = esme.Esme(host='localhost', port=2775, username='u', password='p')
+    e._conn = esme.Connection(address=('localhost', 2775), timeout=5)
+    e._conn._sock = a
+    a.settimeout(5)
+    yield e, b
+    a.close()
+    b.close()
+
+
+@pt.mark.asyncio
+async def test_listen_forever_async_dispatches_pdu(esme_pair, monkeypatch):
+    e, peer = esme_pair
+    received = asyncio.Queue()
+    monkeypatch.setitem(
+        esme._HANDLERS, smpplib.command.SubmitSMResp, received.put_nowait
+    )
+
+    listener = asyncio.create_task(e.listen_forever_async())
+    peer.sendall(SUBMIT_SM_RESP)
+    pdu = await asyncio.wait_for(received.get(), 5)
+    listener.cancel()
+    with pt.raises(asyncio.CancelledError):
+        await listener
+
+    assert isinstance(pdu, smpplib.command.SubmitSMResp)
+    # the synchronous paths get their timeout back once the listener stops
+    assert e._conn._sock.gettimeout() == 5
+
+
+def test_connection_socket_buffers():
+    with socket.create_server(('127.0.0.1', 0)) as server:
+        conn = esme.Connection(
+            address=server.getsockname(), sndbuf=32768, rcvbuf=32768
+        )
+        sock = conn.connect()
+        # the kernel may round the requested size up (Linux doubles it)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) >= 32768
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 32768
+        conn.disconnect()
@@ -0,0 +1,39 @@
+import asyncio
+import socket
+
+import pytest as pt
+
+from smppai.proto import read_data_direct
+
+# enquire_link, sequence 1
+ENQUIRE_LINK = b'\x00\x00\x00\x10\x00\x00\x00\x15\x00\x00\x00\x00\x00\x00\x00\x01'
+
+
+@pt.fixture
+def sockets():
+    a, b = socket.socketpair()
+    a.setblocking(False)
+    yield a, b
+    a.close()
+    b.close()
+
+
+@pt.mark.asyncio
+async def test_read_data_direct_reads_whole_pdu(sockets):
+    a, b = sockets
+    b.sendall(ENQUIRE_LINK * 2)
+
+    assert await read_data_direct(a) == ENQUIRE_LINK
+    assert await read_data_direct(a) == ENQUIRE_LINK
+
+
+@pt.mark.asyncio
+async def test_read_data_direct_eof(sockets):
+    a, b = sockets
+    b.sendall(ENQUIRE_LINK[:10])
+    b.close()
+
+    with pt.raises(asyncio.IncompleteReadError) as e:
+        await read_data_direct(a)
+    assert e.value.partial == ENQUIRE_LINK[:10]
+    assert e.value.expected == len(ENQUIRE_LINK)